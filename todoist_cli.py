@@ -7,26 +7,67 @@ Author: Luke Steuber
 Usage:
     todoist tasks                    # List all tasks
     todoist tasks -p "Work"          # Filter by project
+    todoist tasks --project-id <id>  # Filter by project ID
     todoist projects                 # List projects
     todoist add "Buy groceries"      # Add task
     todoist add "Meeting" -d "tomorrow 3pm" -p 4  # With due date and priority
     todoist complete <task_id>       # Complete task
+    todoist complete <id1> <id2>     # Complete several tasks
     todoist delete <task_id>         # Delete task
 """
 
 import argparse
+import functools
+import itertools
+import json
+import math
 import os
+import random
 import sys
-from datetime import datetime
-from typing import Optional
+import time
+import types
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-# Try to import the official SDK
-try:
+if TYPE_CHECKING:
+    import socket
+
+    import requests
     from todoist_api_python.api import TodoistAPI
-except ImportError:
-    print("Error: The 'todoist-api-python' library is required.")
-    print("Please install it using: pip install todoist-api-python")
-    sys.exit(1)
+
+
+# On-disk cache of project name (lowercased) -> project ID, one file per API key
+CACHE_DIR = os.path.expanduser("~/.todoist_cli")
+PROJECT_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Unix socket served by `todoist daemon`
+SOCKET_PATH = os.path.join(CACHE_DIR, "sock")
+DAEMON_TIMEOUT = 120.0  # seconds a client waits for the daemon's reply
+
+# Upper bound on concurrent API requests (matches the HTTP pool size)
+MAX_WORKERS = 8
+
+# Transient HTTP statuses worth retrying, and the backoff schedule
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# A gateway error doesn't mean a create was rejected, so non-idempotent
+# calls are only retried when the server refused them outright
+RETRY_STATUSES_UNSAFE = frozenset({429})
+RETRY_TRIES = 3
+RETRY_BASE_DELAY = 0.2  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds, caps Retry-After
+
+# Display labels indexed by API priority (index 0 is unused)
+_PRIORITY_LABELS = ("P4", "P4 (Normal)", "P3", "P2", "P1 (High)")
+
+# Bound formatter for task table rows (same layout as format_task_row)
+_ROW_FMT = "{:<20} | {:<12} | {:<15} | {}\n".format
+
+
+class APIError(Exception):
+    """A failed request to the Todoist API (HTTP error or network failure)."""
+
+    def __init__(self, error: Exception):
+        super().__init__(str(error))
+        self.response = getattr(error, 'response', None)
 
 
 def get_api_key() -> str:
@@ -50,9 +91,41 @@ def get_api_key() -> str:
     return api_key
 
 
-def get_api() -> TodoistAPI:
-    """Initialize and return the Todoist API client."""
-    return TodoistAPI(get_api_key())
+@functools.lru_cache(maxsize=1)
+def get_api() -> "TodoistAPI":
+    """
+    Return the shared Todoist API client.
+
+    The client is created once per process so its HTTP session (and the
+    kept-alive connections in its pool) is reused by every API call. The
+    SDK is imported here rather than at module level so that --help and
+    argument errors don't pay its import cost.
+    """
+    # Try to import the official SDK
+    try:
+        from todoist_api_python.api import TodoistAPI
+    except ImportError:
+        print("Error: The 'todoist-api-python' library is required.")
+        print("Please install it using: pip install todoist-api-python")
+        sys.exit(1)
+
+    return TodoistAPI(get_api_key(), session=_make_session())
+
+
+def _make_session() -> "requests.Session":
+    """
+    Create the HTTP session handed to the SDK.
+
+    The pool keeps up to MAX_WORKERS kept-alive connections to the API
+    host, so concurrent calls (batched completes, overlapped page fetches)
+    each get their own socket instead of queueing or reconnecting.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS))
+    return session
 
 
 def format_priority(priority: int) -> str:
@@ -62,8 +135,7 @@ def format_priority(priority: int) -> str:
     Note: Todoist API uses 4 for highest priority (P1 in UI),
     and 1 for normal/lowest priority (P4 in UI).
     """
-    mapping = {4: "P1 (High)", 3: "P2", 2: "P3", 1: "P4 (Normal)"}
-    return mapping.get(priority, "P4")
+    return _PRIORITY_LABELS[priority] if 1 <= priority <= 4 else "P4"
 
 
 def format_task_row(task_id: str, priority: str, due: str, content: str) -> str:
@@ -71,49 +143,298 @@ def format_task_row(task_id: str, priority: str, due: str, content: str) -> str:
     return f"{task_id:<20} | {priority:<12} | {due:<15} | {content}"
 
 
-def get_project_id_by_name(api: TodoistAPI, project_name: str) -> Optional[str]:
-    """Look up project ID by name (case-insensitive)."""
-    for page in api.get_projects():
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert an SDK model (task, project) to a plain dict."""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+
+    import dataclasses
+
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return dict(vars(obj))
+
+
+def _dump_json(data: Any) -> None:
+    """Write ``data`` to stdout as compact JSON."""
+    json.dump(data, sys.stdout, separators=(",", ":"), default=str)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def _page_writer() -> Tuple[Callable[[str], Any], Callable[[], None]]:
+    """
+    Return ``(write, flush_page)`` for streaming a table page by page.
+
+    On a terminal each page is flushed as soon as it is written. When
+    output is piped, ``flush_page`` is a no-op and the regular block
+    buffer batches pages; callers flush once when the table is done.
+    """
+    out = sys.stdout
+    isatty = getattr(out, 'isatty', None)
+    if isatty is not None and isatty():
+        return out.write, out.flush
+    return out.write, lambda: None
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if sent, else jittered backoff."""
+    response = getattr(error, 'response', None)
+    retry_after = getattr(response, 'headers', {}).get('Retry-After')
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = math.nan  # Missing, or an HTTP-date
+
+    # Negative or non-finite values would make time.sleep() raise
+    if math.isfinite(delay):
+        return min(max(0.0, delay), RETRY_MAX_DELAY)
+    return random.uniform(0, RETRY_BASE_DELAY * 2 ** attempt)
+
+
+def _retry(func: Callable[..., Any], *args: Any, tries: int = RETRY_TRIES,
+           statuses: frozenset = RETRY_STATUSES, **kwargs: Any) -> Any:
+    """
+    Call ``func(*args, **kwargs)``, retrying transient API failures.
+
+    Responses with a status in ``statuses`` are retried up to ``tries``
+    attempts in total. Every other request error, and the final failed
+    attempt, is raised as APIError. Pass RETRY_STATUSES_UNSAFE for calls
+    that must not run twice, such as creating a task.
+    """
+    from requests.exceptions import RequestException
+
+    for attempt in range(tries):
+        try:
+            return func(*args, **kwargs)
+        except RequestException as e:
+            if _status_code(e) not in statuses or attempt == tries - 1:
+                raise APIError(e) from e
+            time.sleep(_retry_delay(e, attempt))
+
+
+def _next_page(pages: Iterator[List[Any]]) -> Optional[List[Any]]:
+    """
+    Fetch the next page of a paginated SDK call (None when exhausted).
+
+    The SDK's paginator keeps its cursor when a request fails, so the page
+    can be retried. A generator is finished once it raises, so generators
+    only get one attempt.
+    """
+    tries = 1 if isinstance(pages, types.GeneratorType) else RETRY_TRIES
+    return _retry(next, pages, None, tries=tries)
+
+
+def _iter_pages(pages: Iterable[List[Any]]) -> Iterator[List[Any]]:
+    """Yield pages from a paginated SDK call, retrying each page fetch."""
+    pages = iter(pages)
+    while True:
+        page = _next_page(pages)
+        if page is None:
+            return
+        yield page
+
+
+def _prefetch_pages(pages: Iterable[List[Any]]) -> Iterator[List[Any]]:
+    """
+    Yield pages from a paginated SDK call, requesting the next page in a
+    background thread while the caller handles the current one.
+
+    Todoist paginates with opaque cursors, so page N+1 cannot be requested
+    before page N arrives; this overlaps each request with local work
+    instead. Only use it when the caller consumes every page.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pages = iter(pages)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(_next_page, pages)
+        while True:
+            page = pending.result()
+            if page is None:
+                return
+            pending = pool.submit(_next_page, pages)
+            yield page
+
+
+def _collect_pages(pages: Iterable[List[Any]]) -> List[Any]:
+    """Flatten paginated SDK results into a single list."""
+    return list(itertools.chain.from_iterable(_prefetch_pages(pages)))
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Return the HTTP status code attached to an API error, if any."""
+    return getattr(getattr(error, 'response', None), 'status_code', None)
+
+
+def _key_fingerprint(api_key: str) -> str:
+    """Identify an API key without revealing it."""
+    import hashlib
+
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+
+
+def _project_cache_file() -> str:
+    """Path of the project cache for the current API key."""
+    return os.path.join(CACHE_DIR, f"projects-{_key_fingerprint(get_api_key())[:16]}.json")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_project_cache() -> Dict[str, str]:
+    """
+    Load the project name -> ID cache from disk.
+
+    Each API key has its own cache file, since project IDs belong to one
+    account. The cache is ignored once it is older than PROJECT_CACHE_TTL.
+    The returned dict is memoized for the lifetime of the process, so only
+    the first lookup touches the disk.
+    """
+    path = _project_cache_file()
+    try:
+        if time.time() - os.path.getmtime(path) > PROJECT_CACHE_TTL:
+            return {}
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_project_cache(cache: Dict[str, str], refresh: bool = True) -> None:
+    """
+    Atomically write the project cache to disk (best effort).
+
+    Only a complete project listing should pass ``refresh=True``. Partial
+    updates keep the file's previous mtime (while it is still within the
+    TTL), so entries already on disk still expire on schedule instead of
+    being kept alive by every rewrite.
+    """
+    path = _project_cache_file()
+    mtime = None
+    if not refresh:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            pass
+        if mtime is not None and time.time() - mtime > PROJECT_CACHE_TTL:
+            mtime = None  # Expired file: its entries were not loaded
+
+    import threading
+
+    # Unique per thread too: daemon requests can save concurrently
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+    except OSError:
+        pass
+
+
+def _forget_project(project_name: str) -> None:
+    """Drop a stale entry from the project cache."""
+    cache = _load_project_cache()
+    if cache.pop(project_name.lower(), None) is not None:
+        _save_project_cache(cache, refresh=False)
+
+
+def get_project_id_by_name(api: "TodoistAPI", project_name: str) -> Optional[str]:
+    """
+    Look up project ID by name (case-insensitive).
+
+    Results are served from the on-disk cache when possible. On a miss,
+    every project seen while scanning is added to the cache.
+    """
+    cache = _load_project_cache()
+    key = project_name.lower()
+    if key in cache:
+        return cache[key]
+
+    project_id = None
+    for page in _iter_pages(api.get_projects()):
         for proj in page:
-            if proj.name.lower() == project_name.lower():
-                return proj.id
-    return None
+            # Most lookups use the exact name; skip lowercasing that one
+            exact = proj.name == project_name
+            name = key if exact else proj.name.lower()
+            cache.setdefault(name, proj.id)
+            if exact or name == key:
+                project_id = proj.id
+                break
+        if project_id:
+            break
+
+    _save_project_cache(cache, refresh=False)
+    return project_id
 
 
 def list_tasks(args: argparse.Namespace) -> None:
     """List active tasks with optional project filter."""
     api = get_api()
+    task_params = {}
     try:
-        # Build filter parameters
-        task_params = {}
+        pages = None
 
-        if args.project:
-            # Look up project ID by name
-            project_id = get_project_id_by_name(api, args.project)
+        if args.project_id:
+            # Explicit ID: no project lookup needed
+            task_params['project_id'] = args.project_id
+        elif args.project:
+            project_id = _load_project_cache().get(args.project.lower())
             if project_id:
                 task_params['project_id'] = project_id
             else:
-                print(f"Warning: Project '{args.project}' not found. Showing all tasks.")
-
-        # Collect all tasks from paginated results
-        all_tasks = []
-        for page in api.get_tasks(**task_params):
-            all_tasks.extend(page)
-
-        if not all_tasks:
-            print("No active tasks found.")
+                # Cache miss: resolve the project while fetching all tasks,
+                # then filter client-side
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    lookup = pool.submit(get_project_id_by_name, api, args.project)
+                    fetch = pool.submit(_collect_pages, api.get_tasks())
+                    project_id = lookup.result()
+                    all_tasks = fetch.result()
+
+                if project_id:
+                    all_tasks = [t for t in all_tasks if t.project_id == project_id]
+                else:
+                    print(f"Warning: Project '{args.project}' not found. Showing all tasks.",
+                          file=sys.stderr if args.json else sys.stdout)
+                pages = [all_tasks]
+
+        if pages is None:
+            pages = _prefetch_pages(api.get_tasks(**task_params))
+
+        if args.json:
+            _dump_json([_to_dict(task) for page in pages for task in page])
             return
 
-        # Print header
-        print(format_task_row("ID", "Priority", "Due", "Content"))
-        print("-" * 80)
-
-        for task in all_tasks:
-            due_str = task.due.string if task.due else "No Date"
-            prio = format_priority(task.priority)
-            print(format_task_row(task.id, prio, due_str, task.content))
+        # Stream rows as each page arrives, one write per page
+        write, flush_page = _page_writer()
+        saw_any = False
+        for page in pages:
+            if not page:
+                continue
+            rows = []
+            if not saw_any:
+                rows.append(format_task_row("ID", "Priority", "Due", "Content") + "\n")
+                rows.append("-" * 80 + "\n")
+                saw_any = True
+            for task in page:
+                due_str = task.due.string if task.due else "No Date"
+                prio = format_priority(task.priority)
+                rows.append(_ROW_FMT(task.id, prio, due_str, task.content))
+            write("".join(rows))
+            flush_page()
+
+        if not saw_any:
+            print("No active tasks found.")
+        sys.stdout.flush()
 
-    except Exception as e:
+    except APIError as e:
+        if not args.project_id and 'project_id' in task_params and _status_code(e) == 404:
+            # Cached project ID no longer exists; re-resolve on the next run
+            _forget_project(args.project)
         print(f"Error fetching tasks: {e}")
         sys.exit(1)
 
@@ -134,7 +455,7 @@ def add_task(args: argparse.Namespace) -> None:
         if args.project_id:
             task_params['project_id'] = args.project_id
 
-        task = api.add_task(**task_params)
+        task = _retry(api.add_task, statuses=RETRY_STATUSES_UNSAFE, **task_params)
 
         print(f"Task created successfully!")
         print(f"  ID: {task.id}")
@@ -143,38 +464,75 @@ def add_task(args: argparse.Namespace) -> None:
             print(f"  Due: {task.due.string}")
         print(f"  Priority: {format_priority(task.priority)}")
 
-    except Exception as e:
+    except APIError as e:
         print(f"Error creating task: {e}")
         sys.exit(1)
 
 
+def _for_each_task(func: Callable[..., Any], task_ids: List[str]) -> List[Any]:
+    """
+    Call ``func(task_id=...)`` for every ID, concurrently when there are
+    several.
+
+    Returns results in the same order as ``task_ids``; an exception raised
+    for one ID is returned in its slot rather than aborting the batch.
+    """
+    def call(task_id: str) -> Any:
+        try:
+            return _retry(func, task_id=task_id)
+        except APIError as e:
+            return e
+
+    if len(task_ids) == 1:
+        return [call(task_ids[0])]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(task_ids))) as pool:
+        return list(pool.map(call, task_ids))
+
+
 def complete_task(args: argparse.Namespace) -> None:
-    """Close/Complete a task by ID."""
+    """Close/Complete one or more tasks by ID."""
     api = get_api()
-    try:
-        is_success = api.complete_task(task_id=args.task_id)
-        if is_success:
-            print(f"Task {args.task_id} marked as completed.")
+    results = _for_each_task(api.complete_task, args.task_id)
+
+    failed = 0
+    for task_id, result in zip(args.task_id, results):
+        if isinstance(result, APIError):
+            print(f"Error completing task {task_id}: {result}")
+            failed += 1
+        elif result:
+            print(f"Task {task_id} marked as completed.")
         else:
-            print(f"Error: Could not complete task {args.task_id}.")
-            sys.exit(1)
-    except Exception as e:
-        print(f"Error completing task: {e}")
+            print(f"Error: Could not complete task {task_id}.")
+            failed += 1
+
+    if len(args.task_id) > 1:
+        print(f"Completed {len(args.task_id) - failed} of {len(args.task_id)} tasks.")
+    if failed:
         sys.exit(1)
 
 
 def delete_task(args: argparse.Namespace) -> None:
-    """Delete a task by ID."""
+    """Delete one or more tasks by ID."""
     api = get_api()
-    try:
-        is_success = api.delete_task(task_id=args.task_id)
-        if is_success:
-            print(f"Task {args.task_id} deleted.")
+    results = _for_each_task(api.delete_task, args.task_id)
+
+    failed = 0
+    for task_id, result in zip(args.task_id, results):
+        if isinstance(result, APIError):
+            print(f"Error deleting task {task_id}: {result}")
+            failed += 1
+        elif result:
+            print(f"Task {task_id} deleted.")
         else:
-            print(f"Error: Could not delete task {args.task_id}.")
-            sys.exit(1)
-    except Exception as e:
-        print(f"Error deleting task: {e}")
+            print(f"Error: Could not delete task {task_id}.")
+            failed += 1
+
+    if len(args.task_id) > 1:
+        print(f"Deleted {len(args.task_id) - failed} of {len(args.task_id)} tasks.")
+    if failed:
         sys.exit(1)
 
 
@@ -182,46 +540,79 @@ def list_projects(args: argparse.Namespace) -> None:
     """List all projects."""
     api = get_api()
     try:
-        # Collect all projects from paginated results
-        all_projects = []
-        for page in api.get_projects():
-            all_projects.extend(page)
-
-        if not all_projects:
-            print("No projects found.")
+        # Stream rows as each page arrives, recording name -> ID as we go
+        names = {}
+        json_items = []
+        saw_any = False
+        write, flush_page = _page_writer()
+        for page in _prefetch_pages(api.get_projects()):
+            if not page:
+                continue
+            if args.json:
+                for proj in page:
+                    names.setdefault(proj.name.lower(), proj.id)
+                    json_items.append(_to_dict(proj))
+                continue
+            rows = []
+            if not saw_any:
+                rows.append(f"{'ID':<20} | {'Name'}\n")
+                rows.append("-" * 45 + "\n")
+                saw_any = True
+                # Check for parent_id attribute once (may vary by SDK version)
+                nested = hasattr(page[0], 'parent_id')
+            for proj in page:
+                names.setdefault(proj.name.lower(), proj.id)
+                indent = "  " if nested and proj.parent_id is not None else ""
+                rows.append(f"{proj.id:<20} | {indent}{proj.name}\n")
+            write("".join(rows))
+            flush_page()
+
+        # A full listing is authoritative, so replace the cached map
+        cache = _load_project_cache()
+        cache.clear()
+        cache.update(names)
+        _save_project_cache(cache)
+
+        if args.json:
+            _dump_json(json_items)
             return
 
-        print(f"{'ID':<20} | {'Name'}")
-        print("-" * 45)
-        for proj in all_projects:
-            # Check for parent_id attribute (may vary by SDK version)
-            has_parent = getattr(proj, 'parent_id', None) is not None
-            indent = "  " if has_parent else ""
-            print(f"{proj.id:<20} | {indent}{proj.name}")
-    except Exception as e:
+        if not saw_any:
+            print("No projects found.")
+        sys.stdout.flush()
+    except APIError as e:
         print(f"Error fetching projects: {e}")
         sys.exit(1)
 
 
+def print_task_details(task: Any) -> None:
+    """Print the detail view of a single task."""
+    print(f"Task Details")
+    print("-" * 40)
+    print(f"  ID:          {task.id}")
+    print(f"  Content:     {task.content}")
+    print(f"  Priority:    {format_priority(task.priority)}")
+    print(f"  Due:         {task.due.string if task.due else 'No date'}")
+    print(f"  Created:     {task.created_at}")
+    if task.description:
+        print(f"  Description: {task.description}")
+    if task.labels:
+        print(f"  Labels:      {', '.join(task.labels)}")
+
+
 def get_task(args: argparse.Namespace) -> None:
     """Get details of a single task."""
     api = get_api()
     try:
-        task = api.get_task(task_id=args.task_id)
-
-        print(f"Task Details")
-        print("-" * 40)
-        print(f"  ID:          {task.id}")
-        print(f"  Content:     {task.content}")
-        print(f"  Priority:    {format_priority(task.priority)}")
-        print(f"  Due:         {task.due.string if task.due else 'No date'}")
-        print(f"  Created:     {task.created_at}")
-        if task.description:
-            print(f"  Description: {task.description}")
-        if task.labels:
-            print(f"  Labels:      {', '.join(task.labels)}")
-
-    except Exception as e:
+        task = _retry(api.get_task, task_id=args.task_id)
+
+        if args.json:
+            _dump_json(_to_dict(task))
+            return
+
+        print_task_details(task)
+
+    except APIError as e:
         print(f"Error fetching task: {e}")
         sys.exit(1)
 
@@ -243,45 +634,278 @@ def update_task(args: argparse.Namespace) -> None:
             print("Error: No updates specified. Use --content, --due, or --priority.")
             sys.exit(1)
 
-        is_success = api.update_task(task_id=args.task_id, **update_params)
+        result = _retry(api.update_task, task_id=args.task_id, **update_params)
 
-        if is_success:
-            print(f"Task {args.task_id} updated successfully.")
-        else:
+        if not result:
             print(f"Error: Could not update task {args.task_id}.")
             sys.exit(1)
 
-    except Exception as e:
+        print(f"Task {args.task_id} updated successfully.")
+        if args.quiet:
+            return
+
+        # Newer SDK versions return the updated task; older ones only
+        # return True, so fetch it to show the new state.
+        task = result if hasattr(result, 'content') else _retry(api.get_task, task_id=args.task_id)
+        print()
+        print_task_details(task)
+
+    except APIError as e:
         print(f"Error updating task: {e}")
         sys.exit(1)
 
 
-def main() -> None:
-    """Main entry point for the CLI."""
-    parser = argparse.ArgumentParser(
-        description="Todoist CLI - Manage your Todoist tasks from the command line",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  todoist tasks                         List all active tasks
-  todoist tasks -p "Work"               Filter tasks by project
-  todoist projects                      List all projects
-  todoist add "Buy groceries"           Add a simple task
-  todoist add "Meeting" -d "tomorrow"   Add task with due date
-  todoist add "Urgent" -P 4             Add high-priority task
-  todoist complete <task_id>            Mark task as complete
-  todoist delete <task_id>              Delete a task
-  todoist get <task_id>                 View task details
-  todoist update <task_id> --content "New text"
+def _recv_all(sock: "socket.socket") -> bytes:
+    """Read from a socket until the peer closes its end."""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
 
-Environment:
-  TODOIST_API_KEY    Required. Your Todoist API key.
-        """
+
+def _call_daemon(argv: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Run a command through a running `todoist daemon`.
+
+    Returns the daemon's response, or None if the command was not run by
+    a daemon and should run locally: no daemon is reachable, or it serves
+    a different TODOIST_API_KEY than the caller's.
+    """
+    api_key = os.environ.get('TODOIST_API_KEY')
+    if not api_key or not os.path.exists(SOCKET_PATH):
+        return None
+
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        # Don't hang forever on a stopped (e.g. Ctrl+Z) daemon
+        sock.settimeout(DAEMON_TIMEOUT)
+        try:
+            sock.connect(SOCKET_PATH)
+        except OSError:
+            return None  # Stale socket file
+
+        # Once the request is sent, never fall back to running it locally:
+        # the daemon may already have applied it.
+        try:
+            request = {'argv': argv, 'key': _key_fingerprint(api_key)}
+            sock.sendall(json.dumps(request).encode('utf-8'))
+            sock.shutdown(socket.SHUT_WR)
+            response = json.loads(_recv_all(sock).decode('utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"Error: Lost connection to the Todoist daemon: {e}")
+            print("The command may still have been applied; check before retrying.")
+            sys.exit(1)
+
+    # The daemon refuses (without running anything) requests for another key
+    return None if response.get('refused') else response
+
+
+class _ThreadOutput:
+    """
+    Stand-in for sys.stdout/sys.stderr in the daemon.
+
+    Writes from a thread that is capturing go to that thread's buffer;
+    everything else goes to the original stream. This lets concurrent
+    requests each collect their own output.
+    """
+
+    def __init__(self, stream: Any):
+        import threading
+
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer: Optional[Any]) -> None:
+        """Send this thread's writes to ``buffer`` (None to stop)."""
+        self._local.buffer = buffer
+
+    def _target(self) -> Any:
+        buffer = getattr(self._local, 'buffer', None)
+        return self._stream if buffer is None else buffer
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+def _serve_request(conn: "socket.socket", key_fingerprint: str) -> None:
+    """
+    Run one client command in-process and send back its output.
+
+    Expects sys.stdout and sys.stderr to be _ThreadOutput instances (see
+    run_daemon). Requests made with a different API key than the daemon's
+    are refused so they can't act on the daemon's account.
+    """
+    import contextlib
+    import io
+    import traceback
+
+    try:
+        request = json.loads(_recv_all(conn).decode('utf-8'))
+        argv = [str(arg) for arg in request['argv']]
+        client_key = request['key']
+    except (OSError, ValueError, KeyError, TypeError):
+        return
+
+    if client_key != key_fingerprint:
+        with contextlib.suppress(OSError):
+            conn.sendall(json.dumps({'refused': True}).encode('utf-8'))
+        return
+
+    # Reload the project cache so its TTL (and other processes' updates)
+    # applies to a long-running daemon too
+    _load_project_cache.cache_clear()
+
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    stdout, stderr = sys.stdout, sys.stderr
+    stdout.capture(out)
+    stderr.capture(err)
+    try:
+        try:
+            if _find_command(argv) == "daemon":
+                print("Error: The daemon is already running.")
+                sys.exit(1)
+            run_command(argv)
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except Exception:
+            traceback.print_exc()
+            code = 1
+    finally:
+        stdout.capture(None)
+        stderr.capture(None)
+
+    response = {'stdout': out.getvalue(), 'stderr': err.getvalue(), 'code': code}
+    try:
+        conn.sendall(json.dumps(response).encode('utf-8'))
+    except OSError:
+        pass
+
+
+def _handle_connection(conn: "socket.socket", key_fingerprint: str) -> None:
+    """Serve one daemon client connection (runs on its own thread)."""
+    with conn:
+        conn.settimeout(30)
+        _serve_request(conn, key_fingerprint)
+
+
+def run_daemon(args: argparse.Namespace) -> None:
+    """
+    Serve CLI commands over a Unix socket.
+
+    The daemon keeps one warm API client for its whole lifetime; the
+    project cache is re-read from disk for each request. While it is
+    running, other `todoist` invocations with the same TODOIST_API_KEY
+    forward their arguments to it instead of starting the SDK themselves.
+    Each connection is served on its own thread, so a slow request (e.g.
+    one waiting out a rate limit) doesn't hold up the others.
+    """
+    import contextlib
+    import signal
+    import socket
+    import threading
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("Error: The daemon requires Unix domain socket support.")
+        sys.exit(1)
+
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    if os.path.exists(SOCKET_PATH):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with probe:
+            try:
+                probe.connect(SOCKET_PATH)
+            except OSError:
+                os.unlink(SOCKET_PATH)  # Left behind by a daemon that died
+            else:
+                print(f"Error: A daemon is already listening on {SOCKET_PATH}.")
+                sys.exit(1)
+
+    get_api()  # Import the SDK and open the HTTP session up front
+    key_fingerprint = _key_fingerprint(get_api_key())
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # Socket is only accessible by this user
+    try:
+        server.bind(SOCKET_PATH)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+
+    # Clean up the socket on `kill` as well as Ctrl+C. Signals are only
+    # delivered to this (accepting) thread, never to a request in progress.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    print(f"Todoist daemon listening on {SOCKET_PATH} (Ctrl+C to stop)")
+    sys.stdout.flush()
+
+    sys.stdout = _ThreadOutput(sys.stdout)
+    sys.stderr = _ThreadOutput(sys.stderr)
+    workers = []
+    try:
+        while True:
+            conn, _ = server.accept()
+            worker = threading.Thread(
+                target=_handle_connection,
+                args=(conn, key_fingerprint),
+            )
+            worker.start()
+            workers = [w for w in workers if w.is_alive()] + [worker]
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        with contextlib.suppress(OSError):
+            os.unlink(SOCKET_PATH)
+        # Let requests already in progress finish and send their replies
+        for worker in workers:
+            worker.join()
+
+
+def _priority(value: str) -> int:
+    """argparse type for --priority: an integer from 1 to 4."""
+    try:
+        priority = int(value)
+    except ValueError:
+        priority = 0
+    if 1 <= priority <= 4:
+        return priority
+    raise argparse.ArgumentTypeError(f"priority must be 1-4, got {value!r}")
+
+
+def _add_json_flag(parser: argparse.ArgumentParser) -> None:
+    """Also accept --json after the subcommand name."""
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Print raw JSON instead of formatted output"
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Command: tasks (ls)
+def _add_tasks_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: tasks (ls)"""
     parser_ls = subparsers.add_parser(
         "tasks",
         aliases=["ls", "list"],
@@ -291,17 +915,27 @@ Environment:
         "--project", "-p",
         help="Filter by project name"
     )
+    parser_ls.add_argument(
+        "--project-id",
+        help="Filter by project ID (skips the name lookup; overrides --project)"
+    )
+    _add_json_flag(parser_ls)
     parser_ls.set_defaults(func=list_tasks)
 
-    # Command: projects
+
+def _add_projects_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: projects"""
     parser_proj = subparsers.add_parser(
         "projects",
         aliases=["proj"],
         help="List all projects"
     )
+    _add_json_flag(parser_proj)
     parser_proj.set_defaults(func=list_projects)
 
-    # Command: add
+
+def _add_add_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: add"""
     parser_add = subparsers.add_parser(
         "add",
         aliases=["new", "create"],
@@ -317,9 +951,9 @@ Environment:
     )
     parser_add.add_argument(
         "--priority", "-P",
-        type=int,
-        choices=[1, 2, 3, 4],
+        type=_priority,
         default=1,
+        metavar="{1,2,3,4}",
         help="Priority: 1=P4(normal), 2=P3, 3=P2, 4=P1(high)"
     )
     parser_add.add_argument(
@@ -328,31 +962,39 @@ Environment:
     )
     parser_add.set_defaults(func=add_task)
 
-    # Command: complete (done, close)
+
+def _add_complete_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: complete (done, close)"""
     parser_done = subparsers.add_parser(
         "complete",
         aliases=["done", "close", "finish"],
-        help="Complete a task"
+        help="Complete one or more tasks"
     )
     parser_done.add_argument(
         "task_id",
-        help="The ID of the task to complete"
+        nargs="+",
+        help="The ID(s) of the task(s) to complete"
     )
     parser_done.set_defaults(func=complete_task)
 
-    # Command: delete (rm)
+
+def _add_delete_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: delete (rm)"""
     parser_rm = subparsers.add_parser(
         "delete",
         aliases=["rm", "remove"],
-        help="Delete a task"
+        help="Delete one or more tasks"
     )
     parser_rm.add_argument(
         "task_id",
-        help="The ID of the task to delete"
+        nargs="+",
+        help="The ID(s) of the task(s) to delete"
     )
     parser_rm.set_defaults(func=delete_task)
 
-    # Command: get (show, view)
+
+def _add_get_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: get (show, view)"""
     parser_get = subparsers.add_parser(
         "get",
         aliases=["show", "view"],
@@ -362,9 +1004,12 @@ Environment:
         "task_id",
         help="The ID of the task to view"
     )
+    _add_json_flag(parser_get)
     parser_get.set_defaults(func=get_task)
 
-    # Command: update (edit)
+
+def _add_update_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: update (edit)"""
     parser_update = subparsers.add_parser(
         "update",
         aliases=["edit", "modify"],
@@ -384,18 +1029,107 @@ Environment:
     )
     parser_update.add_argument(
         "--priority", "-P",
-        type=int,
-        choices=[1, 2, 3, 4],
+        type=_priority,
+        metavar="{1,2,3,4}",
         help="New priority"
     )
+    parser_update.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Don't print the updated task"
+    )
     parser_update.set_defaults(func=update_task)
 
-    # Handle no arguments
-    if len(sys.argv) == 1:
-        parser.print_help()
-        sys.exit(0)
 
-    args = parser.parse_args()
+def _add_daemon_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Command: daemon"""
+    parser_daemon = subparsers.add_parser(
+        "daemon",
+        help="Serve commands from a warm background process"
+    )
+    parser_daemon.set_defaults(func=run_daemon)
+
+
+# Subparser builders in help order, with the names/aliases each one registers
+_SUBPARSER_BUILDERS = (
+    (_add_tasks_parser, ("tasks", "ls", "list")),
+    (_add_projects_parser, ("projects", "proj")),
+    (_add_add_parser, ("add", "new", "create")),
+    (_add_complete_parser, ("complete", "done", "close", "finish")),
+    (_add_delete_parser, ("delete", "rm", "remove")),
+    (_add_get_parser, ("get", "show", "view")),
+    (_add_update_parser, ("update", "edit", "modify")),
+    (_add_daemon_parser, ("daemon",)),
+)
+
+# Command name or alias -> subparser builder
+_COMMANDS = {
+    name: build
+    for build, names in _SUBPARSER_BUILDERS
+    for name in names
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+
+    If ``command`` names a known subcommand, only that subparser is added;
+    otherwise (no command, --help, or an unknown name) every subparser is
+    built so help and error messages list all commands.
+    """
+    parser = argparse.ArgumentParser(
+        description="Todoist CLI - Manage your Todoist tasks from the command line",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  todoist tasks                         List all active tasks
+  todoist tasks -p "Work"               Filter tasks by project
+  todoist tasks --project-id <id>       Filter by project ID (no lookup)
+  todoist projects                      List all projects
+  todoist add "Buy groceries"           Add a simple task
+  todoist add "Meeting" -d "tomorrow"   Add task with due date
+  todoist add "Urgent" -P 4             Add high-priority task
+  todoist complete <task_id>            Mark task as complete
+  todoist complete <id1> <id2> ...      Complete several tasks at once
+  todoist delete <task_id>              Delete a task
+  todoist get <task_id>                 View task details
+  todoist update <task_id> --content "New text"
+  todoist tasks --json                  Raw JSON for scripts (also projects, get)
+  todoist daemon &                      Keep a warm client for faster calls
+
+Environment:
+  TODOIST_API_KEY    Required. Your Todoist API key.
+        """
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print raw JSON instead of formatted output (tasks, projects, get)"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    if command in _COMMANDS:
+        _COMMANDS[command](subparsers)
+    else:
+        for build, _ in _SUBPARSER_BUILDERS:
+            build(subparsers)
+
+    return parser
+
+
+def _find_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand name in ``argv`` (the first non-option)."""
+    return next((arg for arg in argv if not arg.startswith("-")), None)
+
+
+def run_command(argv: List[str]) -> None:
+    """Parse ``argv`` (without the program name) and run the command."""
+    # Only build the subparser that will actually be used
+    parser = build_parser(_find_command(argv))
+    args = parser.parse_args(argv)
 
     if hasattr(args, "func"):
         args.func(args)
@@ -403,5 +1137,26 @@ Environment:
         parser.print_help()
 
 
+def main() -> None:
+    """Main entry point for the CLI."""
+    # Handle no arguments
+    if len(sys.argv) == 1:
+        build_parser().print_help()
+        sys.exit(0)
+
+    argv = sys.argv[1:]
+
+    # Hand the command to a running daemon if there is one
+    command = _find_command(argv)
+    if command is not None and command != "daemon":
+        response = _call_daemon(argv)
+        if response is not None:
+            sys.stdout.write(response.get('stdout', ''))
+            sys.stderr.write(response.get('stderr', ''))
+            sys.exit(response.get('code', 1))
+
+    run_command(argv)
+
+
 if __name__ == "__main__":
     main()